@@ -1,8 +1,10 @@
 import copy
+import linecache
 import uuid
 
 from .field import (Field, FieldManager, GremlinID, Integer, String,
-    GremlinLabel, GremlinType, GIZMOEntity, _ImmutableField, Relationship)
+    GremlinLabel, GremlinType, GIZMOEntity, Relationship, _build_field,
+    _SHARED_TYPES)
 from .util import (camel_to_underscore, entity_name, GIZMO_ID, GIZMO_LABEL,
     GIZMO_TYPE, GIZMO_ENTITY)
 
@@ -10,87 +12,160 @@ from .util import (camel_to_underscore, entity_name, GIZMO_ID, GIZMO_LABEL,
 ENTITY_MAP = {}
 
 
-class _EntityType(type):
-
-    def __new__(cls, name, bases, attrs):
-
-        def __init__(self, data=None, data_type='python'):
-
-            if isinstance(self, Edge):
-                if data and 'outV' in data:
-                    self.outV = data['outV']
-
-                    del data['outV']
-                else:
-                    self.outV = None
-
-                if data and 'inV' in data:
-                    self.inV = data['inV']
-
-                    del data['inV']
-                else:
-                    self.inV = None
-
-            data = copy.deepcopy(data or {})
-            fields = {}
-            _all_attrs = {}
-            self._data_type = data_type
-            self._relationships = {}
+def get_entity(name):
+    """returns the entity class registered under its qualified name, the
+    module and class name joined by a period"""
+    return ENTITY_MAP[name]
 
-            def def_fields(obj_attrs):
-                keys = obj_attrs.keys()
 
-                for key, val in obj_attrs.items():
+def _recipe_argument(star, name, values):
+    """mutable constructor arguments, like the dict given to a Map, are deep
+    copied so that entities do not share them"""
+    if all(type(value) in _SHARED_TYPES for value in values):
+        return star + name
 
-                    if isinstance(val, Relationship):
-                        self._relationships[key] = val
+    return '{}deepcopy({})'.format(star, name)
 
-                    if isinstance(val, Field):
-                        fields[key] = copy.deepcopy(val)
 
-                        if not fields[key].name:
-                            fields[key].name = key
-
-            def walk(bases):
-                for base in bases:
-                    _all_attrs.update(base.__dict__)
-                    walk(base.__bases__)
-
-            walk(bases)
-            def_fields(_all_attrs)
-            def_fields(attrs)
-            _all_attrs.update(attrs)
-
-            ast_entity = entity_name(self)
-            allow_undefined = _all_attrs.get('allow_undefined', False)
-            label = attrs.get('label', str(self))
-            _id = attrs.get('id', attrs.get('_id', None))
-            _type = 'vertex' if isinstance(self, Vertex) else 'edge'
-            fields[GIZMO_LABEL[0]] = GremlinLabel(GIZMO_LABEL[1], values=label)
-            fields[GIZMO_ID] = GremlinID(GIZMO_ID, values=_id)
-            fields[GIZMO_TYPE] = GremlinType(GIZMO_TYPE, values=_type)
-            fields[GIZMO_ENTITY] = GIZMOEntity(GIZMO_ENTITY, values=ast_entity)
-            self.fields = FieldManager(fields=fields,
-                allow_undefined=allow_undefined, data_type=data_type)
-
-            if GIZMO_LABEL[0] in data:
-                del data[GIZMO_LABEL[0]]
-
-            self.hydrate(data, True)
+class _EntityType(type):
 
-        attrs['__init__'] = __init__
+    def __new__(cls, name, bases, attrs):
         cls = type.__new__(cls, name, bases, attrs)
-        map_name = '{}.{}'.format(cls.__module__, cls.__name__)
-        ENTITY_MAP[map_name] = cls
+        cls._qualified_name = entity_name(cls)
+        ENTITY_MAP[cls._qualified_name] = cls
+        cls._build_schema(bases, attrs)
+        cls.__init__ = cls._build_init()
 
         return cls
 
+    def _build_schema(cls, bases, attrs):
+        """the fields and relationships of an entity only depend on its class,
+        so they are collected once when the class is defined. Fields are
+        stored with their recipes, the class and constructor arguments they
+        were declared with, so each instance can build its own"""
+        fields = {}
+        relationships = {}
+        _all_attrs = {}
+
+        def def_fields(obj_attrs):
+            for key, val in obj_attrs.items():
+
+                if isinstance(val, Relationship):
+                    relationships[key] = val
+
+                if isinstance(val, Field):
+                    fields[key] = val
+
+        def walk(bases):
+            for base in bases:
+                _all_attrs.update(base.__dict__)
+                walk(base.__bases__)
+
+        walk(bases)
+        def_fields(_all_attrs)
+        def_fields(attrs)
+
+        label = attrs.get('label', str(cls))
+        _id = attrs.get('id', attrs.get('_id', None))
+        _type = cls._entity_type
+        fields[GIZMO_LABEL[0]] = GremlinLabel(GIZMO_LABEL[1], values=label)
+        fields[GIZMO_ID] = GremlinID(GIZMO_ID, values=_id)
+        fields[GIZMO_TYPE] = GremlinType(GIZMO_TYPE, values=_type)
+        fields[GIZMO_ENTITY] = GIZMOEntity(GIZMO_ENTITY,
+            values=cls._qualified_name)
+
+        # kept in name order, which is how the field data is serialized
+        names = sorted(fields, key=lambda key: fields[key].name or key)
+        cls._field_recipes = tuple((name, fields[name], fields[name].recipe)
+            for name in names)
+        cls._relationships_schema = relationships
+        cls._immutable = frozenset(name for name, field in fields.items()
+            if field.immutable)
+
+    def _build_init(cls):
+        """generates an __init__ that is specialized for the entity class.
+        Everything that depends on the schema, like the edge handling and the
+        field constructor calls, is resolved here instead of on every
+        instantiation. allow_undefined is still read when an entity is
+        created, so it can be changed on the class later"""
+        namespace = {
+            '__name__': cls.__module__,
+            'build': _build_field,
+            'deepcopy': copy.deepcopy,
+            'FieldManager': FieldManager,
+            'LABEL': GIZMO_LABEL[0],
+            'relationships': cls._relationships_schema,
+        }
+        lines = ["def __init__(self, data=None, data_type='python'):"]
+
+        if cls._entity_type == 'edge':
+            # the vertices are popped from a shallow copy: the caller's data
+            # is left untouched and the vertices are not deep copied below
+            lines += [
+                "    data = dict(data or {})",
+                "    self.outV = data.pop('outV', None)",
+                "    self.inV = data.pop('inV', None)",
+            ]
+
+        lines += [
+            "    data = deepcopy(data or {})",
+            "    self._data_type = data_type",
+            "    self._relationships = relationships.copy()",
+            "    fields = {",
+        ]
+
+        for i, (name, field, recipe) in enumerate(cls._field_recipes):
+            if recipe is None:
+                # the field was changed after it was declared, so its
+                # constructor arguments would not rebuild it
+                namespace['field_{}'.format(i)] = field
+                lines.append("        {!r}: deepcopy(field_{}),".format(name,
+                    i))
+                continue
+
+            field, args, kwargs = recipe
+            namespace['field_{}'.format(i)] = field
+            call = ['field_{}'.format(i)]
+
+            if args:
+                namespace['args_{}'.format(i)] = args
+                call.append(_recipe_argument('*', 'args_{}'.format(i), args))
+
+            if kwargs:
+                namespace['kwargs_{}'.format(i)] = kwargs
+                call.append(_recipe_argument('**', 'kwargs_{}'.format(i),
+                    kwargs.values()))
+
+            lines.append("        {!r}: build({}),".format(name,
+                ', '.join(call)))
+
+        lines += [
+            "    }",
+            "    self.fields = FieldManager(fields=fields,",
+            "        allow_undefined=self.allow_undefined, data_type=data_type)",
+            "    data.pop(LABEL, None)",
+            "    self.hydrate(data, True)",
+        ]
+
+        # the source is registered with linecache so that tracebacks and
+        # inspect can show the generated code
+        source = '\n'.join(lines) + '\n'
+        filename = '<gizmo generated __init__ {}>'.format(cls._qualified_name)
+        linecache.cache[filename] = (len(source), None,
+            source.splitlines(True), filename)
+
+        exec(compile(source, filename, 'exec'), namespace)
+
+        __init__ = namespace['__init__']
+        __init__.__qualname__ = '{}.__init__'.format(cls.__qualname__)
+
+        return __init__
+
     def __call__(cls, *args, **kwargs):
         entity = super(_EntityType, cls).__call__(*args, **kwargs)
 
-        for k, v in entity.fields.fields.items():
-            if not isinstance(v, _ImmutableField):
-                setattr(entity, k, v)
+        entity.__dict__.update({k: v for k, v in entity.fields.fields.items()
+            if k not in cls._immutable})
 
         return entity
 
@@ -99,9 +174,10 @@ class _EntityType(type):
 
 
 class _Entity(metaclass=_EntityType):
+    allow_undefined = False
+    _entity_type = None
 
     def hydrate(self, data=None, reset_initial=False):
-        from pprint import pprint
         self.fields.hydrate(data, reset_initial)
 
         return self
@@ -167,7 +243,7 @@ class _Entity(metaclass=_EntityType):
 
 
 class Vertex(_Entity):
-    pass
+    _entity_type = 'vertex'
 
 
 class GenericVertex(Vertex):
@@ -175,6 +251,7 @@ class GenericVertex(Vertex):
 
 
 class Edge(_Entity):
+    _entity_type = 'edge'
 
     @property
     def out_v(self):
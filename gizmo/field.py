@@ -1,8 +1,9 @@
 import copy
 import json
+import types
 
-from collections import OrderedDict
 from datetime import datetime
+from operator import itemgetter
 
 from gremlinpy import Param
 
@@ -10,6 +11,29 @@ from .traversal import Traversal
 from .util import is_gremlin_entity
 
 
+# values of these types cannot be changed in place, so they are safe to
+# share without copying them
+_SHARED_TYPES = frozenset((str, int, float, bool, type(None),
+    types.FunctionType, types.BuiltinFunctionType))
+
+
+_BOOLEAN_STRINGS = {'true': True, 'false': False}
+
+
+def _default_converter(value):
+    return value._value
+
+
+def _build_field(field_class, *args, **kwargs):
+    """builds a field without recording its constructor arguments. Only the
+    fields declared on entity classes need them, the ones that are built for
+    each entity would keep them for their whole life"""
+    field = object.__new__(field_class)
+    field.__init__(*args, **kwargs)
+
+    return field
+
+
 class FieldManager:
 
     def __init__(self, fields=None, data_type='python', allow_undefined=False):
@@ -21,7 +45,12 @@ class FieldManager:
             if not field.name:
                 field.name = name
 
+            if field.data_type != data_type:
+                field.data_type = data_type
+
     def _set_data_type(self, data_type):
+        self._data_type = data_type
+
         for name, field in self.fields.items():
             field.data_type = data_type
 
@@ -39,7 +68,7 @@ class FieldManager:
             if not value.name:
                 value.name = name
 
-            if isinstance(value, _ImmutableField):
+            if value.immutable:
                 return value.data
         elif self.allow_undefined:
             value = self._add_undefined_field(name, None)
@@ -65,39 +94,21 @@ class FieldManager:
         self.fields[name].deleted = True
 
     def _add_undefined_field(self, name, value):
-        max_values = None
-        overwrite_last_value = False
         gremlin_entity = is_gremlin_entity(value)
         original_value = copy.deepcopy(value)
 
         if gremlin_entity:
             value = value[0]['value']
 
-        if isinstance(value, dict):
-            field = Map
-            max_values = 1
-            overwrite_last_value = True
-        elif isinstance(value, (list, tuple,)):
-            field = List
-            max_values = 1
-            overwrite_last_value = True
-        elif isinstance(value, bool):
-            field = Boolean
-            max_values = 1
-            overwrite_last_value = True
-        elif isinstance(value, int):
-            field = Integer
-        elif isinstance(value, float):
-            field = Float
-        else:
-            field = String
+        field, max_values, overwrite_last_value = _undefined_field_type(value)
 
         """the field will not be initialized with a value so that it
         will register as 'added'. We also need to determine if the value is
         a response from the Gremlin server or if it is a plain value
         """
-        f = field(name=name, data_type=self.data_type, max_values=max_values,
-                  overwrite_last_value=overwrite_last_value)
+        f = _build_field(field, name=name, data_type=self.data_type,
+                         max_values=max_values,
+                         overwrite_last_value=overwrite_last_value)
 
         # if isinstance(value, (list, tuple)) and len(value) and \
         #     isinstance(value[0], dict) and 'value' in value[0]:
@@ -115,15 +126,19 @@ class FieldManager:
         return self.fields[name]
 
     def hydrate(self, data, reset_initial=False):
+        fields = self.fields
+
         for key, val in data.items():
-            if key in self.fields:
+            field = fields.get(key, None)
+
+            if field is not None:
                 if is_gremlin_entity(val):
                     for v in val:
-                        self.fields[key] + Value(value=v.get('value', None),
+                        field + Value(value=v.get('value', None),
                             properties=v.get('properties', None),
                             id=v.get('id', None))
                 else:
-                    self.fields[key] + val
+                    field + val
             elif self.allow_undefined:
                 self._add_undefined_field(key, val)
 
@@ -135,45 +150,57 @@ class FieldManager:
 
         return self
 
+    def _collect(self, attr):
+        """builds a name sorted dict of the given field attribute, skipping
+        empty results. Each field's attribute is only read once"""
+        collected = []
+
+        for field in self.fields.values():
+            value = getattr(field, attr)
+
+            if value:
+                collected.append((field.name, value))
+
+        return dict(sorted(collected, key=itemgetter(0)))
+
     @property
     def data(self):
-        data = {field.name: field.data for name, field in self.fields.items()
-                    if field.data}
-
-        return OrderedDict(sorted(data.items()))
+        return self._collect('data')
 
     @property
     def values(self):
-        values = {field.name: field.values for name, field in
-                    self.fields.items() if field.values}
-
-        return OrderedDict(sorted(values.items()))
+        return self._collect('values')
 
     @property
     def changes(self):
-        changes = {field.name: field.changes for name, field in
-                    self.fields.items() if field.changes}
-
-        return OrderedDict(sorted(changes.items()))
+        return self._collect('changes')
 
     @property
     def changed(self):
-        return [name for name, changes in self.changes.items() if
-            changes['deleted'] or changes['values']]
+        return sorted(field.name for field in self.fields.values()
+                      if field.changed)
 
     @property
     def deleted(self):
-        return [name for name, changes in self.changes.items() if
-            changes['deleted']]
+        return sorted(field.name for field in self.fields.values()
+                      if field.deleted)
 
 
 class Field:
+    __slots__ = ('name', 'default', '_values', '_data_type', 'deleted',
+                 '_init_args')
+    immutable = False
+
+    def __new__(cls, *args, **kwargs):
+        field = super().__new__(cls)
+        field._init_args = (args, kwargs)
+
+        return field
 
     def __init__(self, name=None, values=None, data_type='python',
                  max_values=None, overwrite_last_value=False,
                  default=None):
         self.name = name
-        self.immutable = isinstance(self, _ImmutableField)
         self.default = default
         self._values = ValueManager(values=values, data_type=data_type,
                                     to_python=self.to_python,
@@ -187,7 +214,8 @@ class Field:
         self.deleted = False
 
     def __repr__(self):
-        return '%s(%r)'.format(self.__class__, self.__dict__)
+        return '{}(name={!r}, values={!r})'.format(self.__class__.__name__,
+                                                 self.name, self.values)
 
     def __getitem__(self, value):
         return self._values[value]
@@ -205,6 +233,7 @@ class Field:
             return self._values + value
 
     def _set_data_type(self, data_type):
+        self._data_type = data_type
         self._values.data_type = data_type
 
     def _get_data_type(self):
@@ -218,9 +247,9 @@ class Field:
 
     @property
     def value(self):
-        values = self.values
+        values = self._values.filtered_values
 
-        return values[-1] if values else None
+        return values[-1].value if values else None
 
     @property
     def data(self):
@@ -238,10 +267,43 @@ class Field:
             'immutable': self.immutable,
         }
 
+    @property
+    def changed(self):
+        return self.deleted or self._values.changed
+
     @property
     def default_value(self):
         return None
 
+    @property
+    def recipe(self):
+        """the class and constructor arguments that the field was declared
+        with. Calling the class with them builds a new, equal field. It is
+        None when the field was not built from a recorded call or when it was
+        changed after it was constructed, e.g. a value was added to it"""
+        init_args = getattr(self, '_init_args', None)
+
+        if init_args is None:
+            return None
+
+        args, kwargs = init_args
+        built = _build_field(self.__class__, *args, **kwargs)
+
+        if built._state() != self._state():
+            # the arguments no longer describe the field
+            self._init_args = None
+
+            return None
+
+        return self.__class__, args, kwargs
+
+    def _state(self):
+        values = self._values
+
+        return (self.name, self.default, self._data_type, self.deleted,
+                [(v._raw_value, v.properties, v.id) for v in values._values],
+                len(values._deleted))
+
     def empty(self):
         self._values.empty()
 
@@ -258,6 +320,9 @@ class Field:
 
 
 class ValueManager:
+    __slots__ = ('_values', '_deleted', '_data_type', 'default', 'max_values',
+                 'overwrite_last_value', '_to_python', '_to_graph',
+                 '_can_set', 'filter_field', '_initial')
 
     def __init__(self, values=None, data_type='python', reset_initial=True,
                  to_python=None, to_graph=None, filter_field=None,
@@ -316,17 +381,9 @@ class ValueManager:
 
     def __add__(self, value):
         if isinstance(value, Value):
-            if not self._can_set(value.value):
-                return self
-
-            self.add_value(value.value, value.properties, value.id)
-
-            return self
-        else:
-            if not self._can_set(value):
-                return self
+            return self.add_value(value.value, value.properties, value.id)
 
-            return self.add_value(value, properties=None)
+        return self.add_value(value, properties=None)
 
     def __len__(self):
         return len(self.filtered_values)
@@ -362,6 +419,7 @@ class ValueManager:
     def _set_data_type(self, data_type):
         converter = self._to_python if data_type == 'python'\
             else self._to_graph
+        self._data_type = data_type
 
         for value in self._values:
             value.converter = converter
@@ -426,6 +484,19 @@ class ValueManager:
     def data(self):
         return [v.data for v in self.filtered_values]
 
+    @property
+    def changed(self):
+        """checks for the same changes that are reported by the changes
+        property, but stops at the first one that is found"""
+        if self._deleted:
+            return True
+
+        for v in self.filtered_values:
+            if v not in self._initial or v.changes:
+                return True
+
+        return False
+
     @property
     def changes(self):
         changed = {'values': self.values}
@@ -460,14 +531,20 @@ class ValueManager:
 
 
 class Value:
+    __slots__ = ('_raw_value', '_callable', '_initial', 'id', 'properties',
+                 'converter')
 
     def __init__(self, value, properties=None, id=None):
-        self._value = value
+        self._raw_value = value
         self._callable = callable(value)
-        self._initial = copy.deepcopy(value)
         self.id = id
         self.properties = properties or {}
-        self.converter = lambda value: value._value
+        self.converter = _default_converter
+
+        if type(value) in _SHARED_TYPES:
+            self._initial = value
+        else:
+            self._initial = copy.deepcopy(value)
 
     def __setitem__(self, key, value):
         self._properties[key] = value
@@ -475,20 +552,23 @@ class Value:
     def __getitem__(self, key):
         return self._properties.get(key, None)
 
-    def __getattribute__(self, attr):
-        val = object.__getattribute__(self, attr)
+    def _get_raw_value(self):
+        if self._callable:
+            return self._raw_value()
 
-        if attr == '_value' and self._callable:
-            return val()
-        else:
-            return val
+        return self._raw_value
+
+    def _set_raw_value(self, value):
+        self._raw_value = value
+
+    _value = property(_get_raw_value, _set_raw_value)
 
     def get_value(self):
         return self.converter(self)
 
     def set_value(self, value):
         self._callable = callable(value)
-        self._value = value
+        self._raw_value = value
 
     value = property(get_value, set_value)
 
@@ -598,7 +678,8 @@ class Property:
 
 
 class _ImmutableField:
-    default = ''
+    __slots__ = ()
+    immutable = True
 
     @property
     def values(self):
@@ -613,6 +694,7 @@ class _ImmutableField:
 
 
 class String(Field):
+    __slots__ = ()
 
     def to_python(self, value):
         try:
@@ -625,15 +707,22 @@ class String(Field):
 
 
 class Integer(Field):
+    __slots__ = ()
 
     def to_python(self, value):
+        val = value._value
+
+        if type(val) is int:
+            return val
+
         try:
-            return int(float(value._value))
+            return int(float(val))
         except:
             return 0
 
 
 class Increment(Integer):
+    __slots__ = ()
 
     @property
     def default_value(self):
@@ -646,27 +735,39 @@ class Increment(Integer):
 
 
 class Float(Field):
+    __slots__ = ()
+
+    def _convert(self, value):
+        if type(value) is float:
+            return value
 
-    def to_python(self, value):
         try:
-            return float(value._value)
+            return float(value)
         except:
             return 0.0
 
+    def to_python(self, value):
+        return self._convert(value._value)
+
 
 class Boolean(Field):
+    __slots__ = ()
 
     @property
     def default_value(self):
         return False
 
     def _convert(self, value):
-        if str(value).lower().strip() not in ['true', 'false']:
-            value = bool(value)
+        if type(value) is bool:
+            return value
 
-        value = str(value).lower().strip()
+        if isinstance(value, str):
+            converted = _BOOLEAN_STRINGS.get(value.strip().lower(), None)
 
-        return bool(json.loads(value))
+            if converted is not None:
+                return converted
+
+        return bool(value)
 
     def to_python(self, value):
         try:
@@ -679,6 +780,8 @@ class Boolean(Field):
 
 
 class Map(Field):
+    __slots__ = ()
+    empty_type = dict
 
     def __init__(self, name=None, values=None, data_type='python', *args,
                  **kwargs):
@@ -697,14 +800,20 @@ class Map(Field):
         return {'value': {}}
 
     def to_python(self, value):
-        if (isinstance(value._value, str) and
-            len(value._value.replace(' ', ''))):
-            return json.loads(value._value)
-        else:
-            return value._value
+        val = value._value
+
+        if isinstance(val, str):
+            if not val or val.isspace():
+                return self.empty_type()
+
+            return json.loads(val)
+
+        return val
 
 
 class List(Map):
+    __slots__ = ()
+    empty_type = list
 
     @property
     def default_value(self):
@@ -716,6 +825,7 @@ class List(Map):
 
 
 class Option(Field):
+    __slots__ = ('options',)
 
     def __init__(self, options, name=None, values=None, data_type='python',
                  *args, **kwargs):
@@ -732,6 +842,7 @@ class Option(Field):
 
 
 class DateTime(Float):
+    __slots__ = ()
 
     def to_python(self, value):
         val = value._value
@@ -739,20 +850,15 @@ class DateTime(Float):
         if isinstance(val, datetime):
             val = val.timestamp()
 
-        v = Value(value=val, properties=value.properties, id=value.id)
-
-        return super().to_python(value=v)
+        return self._convert(val)
 
 
 class TimeStamp(DateTime):
+    __slots__ = ()
 
     def __init__(self, name=None, values=None, data_type='python', *args,
                  **kwargs):
-
-        def default():
-            return datetime.now()
-
-        kwargs['default'] = default
+        kwargs['default'] = datetime.now
 
         super().__init__(name=name, values=values, data_type=data_type,
                          max_values=1, overwrite_last_value=False, *args,
@@ -762,20 +868,48 @@ class TimeStamp(DateTime):
         return False
 
 
+# maps the type of a value to the field class, max_values and
+# overwrite_last_value used when it is added as an undefined field
+_UNDEFINED_FIELDS = {
+    dict: (Map, 1, True),
+    list: (List, 1, True),
+    tuple: (List, 1, True),
+    bool: (Boolean, 1, True),
+    int: (Integer, None, False),
+    float: (Float, None, False),
+    str: (String, None, False),
+    type(None): (String, None, False),
+}
+
+
+def _undefined_field_type(value):
+    field_type = _UNDEFINED_FIELDS.get(type(value), None)
+
+    if field_type:
+        return field_type
+
+    # subclasses of the mapped types, e.g. an OrderedDict
+    for _type in type(value).__mro__:
+        if _type in _UNDEFINED_FIELDS:
+            return _UNDEFINED_FIELDS[_type]
+
+    return String, None, False
+
+
 class GremlinID(_ImmutableField, String):
-    pass
+    __slots__ = ()
 
 
 class GremlinLabel(GremlinID):
-    pass
+    __slots__ = ()
 
 
 class GremlinType(GremlinLabel):
-    pass
+    __slots__ = ()
 
 
 class GIZMOEntity(GremlinID):
-    pass
+    __slots__ = ()
 
 
 class Relationship(Traversal):
@@ -7,7 +7,7 @@ from collections import OrderedDict
 from gremlinpy.gremlin import Gremlin, Param, AS
 
 from .entity import (_Entity, Vertex, Edge, GenericVertex, GenericEdge,
-    ENTITY_MAP)
+    get_entity)
 from .exception import (AstronomerQueryException, AstronomerMapperException)
 from .traversal import Traversal
 from .util import (camel_to_underscore, GIZMO_ID, GIZMO_LABEL, GIZMO_TYPE,
@@ -54,7 +54,7 @@ def next_param_name(param):
 
 def next_param(param, value):
     if isinstance(value, _Entity):
-        value = entity_name(value)
+        value = value._qualified_name
 
     return Param(next_param_name(param), value)
 
@@ -673,7 +673,7 @@ class EntityMapper(metaclass=_RootMapper):
                     if isinstance(name, (list, tuple)):
                         name = name[0]['value']
 
-                    entity = ENTITY_MAP[name](data=data, data_type=data_type)
+                    entity = get_entity(name)(data=data, data_type=data_type)
 
                     for f, r in entity._relationships.items():
                         r._mapper = self.mapper
@@ -1,11 +1,12 @@
 import unittest
+import inspect
 import json
 from random import randrange, random
 from pprint import pprint
 
-from gizmo.entity import Vertex, Edge, GenericVertex
+from gizmo.entity import Vertex, Edge, GenericVertex, get_entity
 from gizmo.field import *
-from gizmo.util import camel_to_underscore, GIZMO_LABEL
+from gizmo.util import camel_to_underscore, GIZMO_LABEL, GIZMO_ENTITY
 
 from gremlinpy.gremlin import Gremlin
 
@@ -41,6 +42,20 @@ class EntityTests(unittest.TestCase):
         self.assertTrue(isinstance(v, Vertex))
         self.assertEqual(v['type'], 'vertex')
 
+    def test_can_get_entity_by_qualified_name(self):
+        name = '{}.{}'.format(TestVertex.__module__, TestVertex.__name__)
+
+        self.assertEqual(name, TestVertex._qualified_name)
+        self.assertIs(TestVertex, get_entity(name))
+        self.assertEqual(name, TestVertex()[GIZMO_ENTITY])
+
+    def test_generated_init_can_be_inspected(self):
+        source = inspect.getsource(TestEdge.__init__)
+
+        self.assertEqual(TestEdge.__module__, TestEdge.__init__.__module__)
+        self.assertIn('def __init__(self', source)
+        self.assertIn("data.pop('outV', None)", source)
+
     def test_can_access_fields_as_items_or_attributes(self):
         v = TestVertex({'id': 7})
         i_id = v.id
@@ -75,6 +90,18 @@ class EntityTests(unittest.TestCase):
             self.assertEqual(1, len(data[k]))
             self.assertEqual(v, data[k][0]['value'])
 
+    def test_can_create_edge_without_changing_data(self):
+        out_v = TestVertex()
+        in_v = TestVertex()
+        d = {'outV': out_v, 'inV': in_v, 'some_field': '1'}
+        e = TestEdge(d)
+
+        self.assertIs(out_v, e.out_v)
+        self.assertIs(in_v, e.in_v)
+        self.assertIn('outV', d)
+        self.assertIn('inV', d)
+        self.assertNotIn('outV', e.data)
+
     def test_can_add_undefined_field_to_undefied_vertex(self):
         d = {'one': 1, 'two': 2, 'three': 3}
         v = TestUndefinedVertex(d)
@@ -125,6 +152,16 @@ class EntityTests(unittest.TestCase):
 
         self.assertEqual(t, v.data_type)
 
+    def test_datatype_is_passed_to_fields(self):
+        v = TestVertex(data_type='graph')
+
+        self.assertEqual('graph', v.fields['some_field'].data_type)
+
+        v.data_type = 'python'
+
+        self.assertEqual('python', v.fields.data_type)
+        self.assertEqual('python', v.fields['some_field'].data_type)
+
     def test_can_add_undefined_fields(self):
         v = TestUndefinedVertex()
         fields = v.fields
@@ -148,6 +185,22 @@ class EntityTests(unittest.TestCase):
         self.assertIsInstance(fields['li'], List)
         self.assertIsInstance(fields['s'], String)
 
+    def test_can_allow_undefined_fields_after_class_creation(self):
+        class LateUndefinedVertex(Vertex):
+            pass
+
+        LateUndefinedVertex.allow_undefined = True
+        v = LateUndefinedVertex({'some_field': str(random())})
+
+        self.assertIn('some_field', v.fields.fields)
+
+    def test_undefined_fields_keep_data_order(self):
+        keys = ['c', 'b', 'a', 'f', 'e', 'd']
+        v = TestUndefinedVertex({key: str(random()) for key in keys})
+        undefined = [key for key in v.fields.fields if key in keys]
+
+        self.assertEqual(keys, undefined)
+
     def test_can_get_undefiend_field(self):
         v = TestUndefinedVertex()
         n = 'name'
@@ -210,6 +263,61 @@ class EntityTests(unittest.TestCase):
         self.assertIn('diamon_field', data)
         self.assertIsInstance(ins.fields['name'], String)
 
+    def test_entities_do_not_share_field_instances(self):
+        v = TestVertex({'some_field': 'one'})
+        v2 = TestVertex()
+        v['some_field'] = 'two'
+
+        self.assertIsNot(v.fields['some_field'], v2.fields['some_field'])
+        self.assertEqual([], v2.fields['some_field'].values)
+        self.assertEqual(['two'], v.fields['some_field'].values)
+
+    def test_entities_do_not_share_declared_mutable_values(self):
+        class MapVertex(Vertex):
+            some_map = Map(values={'key': 'value'})
+
+        v = MapVertex()
+        v2 = MapVertex()
+        v.fields['some_map'].values[0]['key'] = str(random())
+
+        self.assertEqual({'key': 'value'}, v2.fields['some_map'].values[0])
+        self.assertEqual({'key': 'value'}, MapVertex.some_map.values[0])
+
+    def test_entities_keep_values_added_to_declared_fields(self):
+        some_map = Map()
+        some_map + {'key': 'value'}
+
+        class MapVertex(Vertex):
+            added_map = some_map
+
+        v = MapVertex()
+        v2 = MapVertex()
+        v.fields['added_map'].values[1]['key'] = str(random())
+
+        self.assertEqual([{}, {'key': 'value'}],
+            v2.fields['added_map'].values)
+        self.assertEqual([{}, {'key': 'value'}], some_map.values)
+
+    def test_can_get_changed_fields(self):
+        v = TestVertex()
+
+        self.assertNotIn('some_field', v.changed)
+
+        v['some_field'] = str(random())
+
+        self.assertIn('some_field', v.changed)
+        self.assertNotIn('type', v.changed)
+
+    def test_can_get_deleted_fields(self):
+        v = TestVertex({'some_field': str(random())})
+
+        self.assertEqual([], v.deleted)
+
+        del v['some_field']
+
+        self.assertEqual(['some_field'], v.deleted)
+        self.assertIn('some_field', v.changed)
+
     def test_can_create_fields_from_json_gremlin_response(self):
         j = '{"requestId":"cce2b0ff-10ff-472f-847e-35c5efdd813a","status":{"message":"","code":200,"attributes":{}},"result":{"data":[{"id":4,"label":"vertex","type":"vertex","properties":{"__GIZMO_ENTITY__":[{"id":31,"value":"gizmo.test.mapper.TestVertex"}],"name":[{"id":34,"value":"mark","properties":{"age":35}}],"id":[{"id":32,"value":"0.28441421794883837"}],"type":[{"id":33,"value":"vertex"}]}}],"meta":{}}}'
         j = json.loads(j)
@@ -806,6 +806,14 @@ class IntegerTests(unittest.TestCase):
         self.assertIsInstance(values[0], int)
         self.assertEqual(values[0], 0)
 
+    def test_will_keep_precision_of_large_integers(self):
+        big = 2 ** 60 + 1
+        f = Integer(values=big)
+        f2 = Integer(values=big, data_type='graph')
+
+        self.assertEqual([big], f.values)
+        self.assertEqual([big], f2.values)
+
     def test_will_ensure_that_none_values_return_zero_when_converted_to_python(self):
         f = Integer()
         f += None
@@ -1045,6 +1053,18 @@ class MapTests(unittest.TestCase):
         self.assertIsInstance(f.values[0], dict)
         self.assertEqual(len(f.values[0]), len(j))
 
+    def test_can_get_dict_from_json_string(self):
+        ol = '{"name": "mark", "loc": {"city": "here"}}'
+        f = Map(values=ol)
+
+        self.assertEqual(json.loads(ol), f.values[0])
+
+    def test_will_get_empty_dict_from_blank_string(self):
+        for blank in ('', ' \n '):
+            f = Map(values=blank)
+
+            self.assertEqual({}, f.values[0])
+
     def test_will_ensure_that_none_values_return_dict_when_converted_to_python(self):
         f = Map()
         f += None
@@ -1062,6 +1082,12 @@ class MapTests(unittest.TestCase):
 
 class ListTests(unittest.TestCase):
 
+    def test_will_get_empty_list_from_blank_string(self):
+        for blank in ('', ' \n '):
+            f = List(values=blank)
+
+            self.assertEqual([], f.values[0])
+
     def test_can_get_empty_list_from_none(self):
         f = List()
 
@@ -1381,7 +1407,7 @@ class FieldManagerTests(unittest.TestCase):
         deleted = v.deleted
 
         self.assertEqual(len(deleted), 1)
-        self.assertEqual(len(v.changed), 2)
+        self.assertEqual(v.changed, ['age'])
 
     def test_can_get_data_from_fields_including_immutable(self):
         iid = str(random())
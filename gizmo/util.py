@@ -1,14 +1,17 @@
 import re
+import sys
 import time
 
 from timeit import default_timer
 
 
-GIZMO_ID = 'id'
-GIZMO_LABEL = ('label', 'T.label')
-GIZMO_TYPE = 'type'
-GIZMO_ENTITY = '__GIZMO_ENTITY__'
-GIZMO_VARIABLE = 'gizmo_var'
+# these are used as dict keys for every field lookup, interning them lets
+# the lookups succeed on identity
+GIZMO_ID = sys.intern('id')
+GIZMO_LABEL = (sys.intern('label'), sys.intern('T.label'))
+GIZMO_TYPE = sys.intern('type')
+GIZMO_ENTITY = sys.intern('__GIZMO_ENTITY__')
+GIZMO_VARIABLE = sys.intern('gizmo_var')
 
 
 def camel_to_underscore(name):